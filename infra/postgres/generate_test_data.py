@@ -11,10 +11,17 @@ Examples:
 """
 
 import argparse
+import csv
+import io
+import os
+import struct
 import sys
-from datetime import datetime, timedelta
-from random import choice, randint, random
-from typing import List, Tuple
+from dataclasses import dataclass, fields
+from datetime import datetime
+from itertools import chain, islice
+from multiprocessing import Pool
+from random import randint, seed as rng_seed
+from typing import Iterator, List, Tuple
 from uuid import uuid4
 
 try:
@@ -23,262 +30,627 @@ except ImportError:
     print("Error: Faker is not installed. Install it with: pip install faker", file=sys.stderr)
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy is not installed. Install it with: pip install numpy", file=sys.stderr)
+    sys.exit(1)
+
+# Optional: JIT-compile the numeric sampling helpers. The helpers are plain
+# numpy either way, so missing numba just means they run interpreted.
+try:
+    from numba import njit as _njit
+except ImportError:
+    def _njit(**_kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+# Counts below this run in-process; worker startup isn't worth it
+_MIN_SHARD_ROWS = 500
+
+# Rows per INSERT ... VALUES statement. PostgreSQL stops gaining past ~1000
+# rows per batch and regresses on very large statements, so stay at the
+# sweet spot instead of emitting one monolithic INSERT per table.
+_INSERT_BATCH_ROWS = 1000
+
+
+def _batched(rows, size: int):
+    """Yield successive lists of at most `size` items from an iterable."""
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# Generated rows are kept columnar (struct-of-arrays): one Python list per
+# column instead of one tuple per row. For millions of rows that drops the
+# per-row tuple headers from peak RSS, and the emitters reconstitute rows
+# transiently with zip, one output batch at a time.
+
+@dataclass
+class AuthorBatch:
+    """Columnar author rows."""
+    ids: List[str]
+    usernames: List[str]
+    emails: List[str]
+    created_ats: List[str]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def rows(self) -> Iterator[Tuple]:
+        """Iterate (id, username, email, created_at) tuples."""
+        return zip(self.ids, self.usernames, self.emails, self.created_ats)
+
+
+@dataclass
+class ArticleBatch:
+    """Columnar article rows. publish_dates holds None for drafts."""
+    ids: List[str]
+    titles: List[str]
+    contents: List[str]
+    publish_dates: List[str]
+    published: List[bool]
+    author_ids: List[str]
+    created_ats: List[str]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def rows(self) -> Iterator[Tuple]:
+        """Iterate (id, title, content, publish_date, is_published, author_id, created_at) tuples."""
+        return zip(self.ids, self.titles, self.contents, self.publish_dates,
+                   self.published, self.author_ids, self.created_ats)
+
+
+@dataclass
+class CommentBatch:
+    """Columnar comment rows."""
+    ids: List[str]
+    article_ids: List[str]
+    author_names: List[str]
+    author_emails: List[str]
+    contents: List[str]
+    comment_dates: List[str]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def rows(self) -> Iterator[Tuple]:
+        """Iterate (id, article_id, author_name, author_email, content, comment_date, created_at) tuples."""
+        return zip(self.ids, self.article_ids, self.author_names,
+                   self.author_emails, self.contents, self.comment_dates,
+                   self.comment_dates)
+
+
+def _merge_batches(batches):
+    """Concatenate per-shard batches column-wise into one batch."""
+    if len(batches) == 1:
+        return batches[0]
+    cls = type(batches[0])
+    return cls(*[
+        list(chain.from_iterable(getattr(batch, field.name) for batch in batches))
+        for field in fields(cls)
+    ])
+
+
+def _bulk_datetimes(now: "np.datetime64", days_ago: "np.ndarray") -> List[str]:
+    """Format now minus per-row day offsets as 'YYYY-MM-DD HH:MM:SS' strings."""
+    stamps = np.datetime_as_string(now - days_ago.astype('timedelta64[D]'), unit='s')
+    return np.char.replace(stamps, 'T', ' ').tolist()
+
+
+def _bulk_uuids(count: int) -> List[str]:
+    """
+    Build `count` random UUID strings from one os.urandom call.
+
+    uuid.uuid4() pays a syscall plus Python-level formatting per call;
+    hex-encoding a single 16*count byte buffer and slicing it amortizes
+    both across the batch.
+    """
+    hex_str = os.urandom(16 * count).hex()
+    return [
+        f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+        for h in (hex_str[i:i + 32] for i in range(0, 32 * count, 32))
+    ]
+
+
+# Sidecar record layout shared with verify_relationships.py: one packed
+# 33-byte record per row — table kind, raw 16-byte pk, raw 16-byte fk
+# (zero for authors, whose rows carry none). The verifier reads this
+# instead of parsing SQL when it is present next to the dump.
+_SIDECAR_RECORD = struct.Struct('<B16s16s')
+_SIDECAR_KIND_AUTHORS, _SIDECAR_KIND_ARTICLES, _SIDECAR_KIND_COMMENTS = 0, 1, 2
+_SIDECAR_NULL_FK = bytes(16)
+
+
+def sidecar_path(sql_path: str) -> str:
+    """Path of the UUID sidecar written next to a SQL output file."""
+    return os.path.splitext(sql_path)[0] + '.uuids.bin'
+
+
+def write_uuid_sidecar(sql_path: str, authors, articles, comments) -> None:
+    """Write the pk/fk sidecar for a SQL output file."""
+    pack = _SIDECAR_RECORD.pack
+    raw = bytes.fromhex
+    with open(sidecar_path(sql_path), 'wb') as f:
+        f.writelines(chain(
+            (pack(_SIDECAR_KIND_AUTHORS, raw(pk.replace('-', '')), _SIDECAR_NULL_FK)
+             for pk in authors.ids),
+            (pack(_SIDECAR_KIND_ARTICLES, raw(pk.replace('-', '')), raw(fk.replace('-', '')))
+             for pk, fk in zip(articles.ids, articles.author_ids)),
+            (pack(_SIDECAR_KIND_COMMENTS, raw(pk.replace('-', '')), raw(fk.replace('-', '')))
+             for pk, fk in zip(comments.ids, comments.article_ids)),
+        ))
+
+
+# Single-quote escaping for SQL literals, done via str.translate with a
+# prebuilt table: one C-level pass over the string instead of str.replace's
+# search-and-copy. Backslashes need no doubling with PostgreSQL's default
+# standard_conforming_strings.
+_SQL_ESC = str.maketrans({"'": "''"})
+
+# Pre-parsed %-templates for SQL row assembly: applying a parsed template is
+# cheaper than re-evaluating an f-string per row
+_AUTHOR_ROW_TMPL = "('%s', '%s', '%s', '%s')"
+_ARTICLE_ROW_TMPL = "('%s', '%s', '%s', %s, %s, '%s', '%s', '%s')"
+_COMMENT_ROW_TMPL = "('%s', '%s', '%s', '%s', '%s', '%s', '%s')"
+
+
+def _author_sql_row(row: Tuple[str, str, str, str]) -> str:
+    """Format one author tuple as an INSERT VALUES row."""
+    return _AUTHOR_ROW_TMPL % row
+
+
+def _article_sql_row(row: Tuple) -> str:
+    """Format one article tuple as an INSERT VALUES row."""
+    uuid_str, title, content, publish_date, is_published, author_id, created_at = row
+    return _ARTICLE_ROW_TMPL % (
+        uuid_str,
+        title.translate(_SQL_ESC),
+        content.translate(_SQL_ESC),
+        f"'{publish_date}'" if publish_date is not None else "NULL",
+        "TRUE" if is_published else "FALSE",
+        author_id,
+        created_at,
+        created_at,
+    )
+
+
+def _comment_sql_row(row: Tuple[str, str, str, str, str, str, str]) -> str:
+    """Format one comment tuple as an INSERT VALUES row."""
+    uuid_str, article_id, author_name, author_email, content, comment_date, created_at = row
+    return _COMMENT_ROW_TMPL % (
+        uuid_str,
+        article_id,
+        author_name.translate(_SQL_ESC),
+        author_email,
+        content.translate(_SQL_ESC),
+        comment_date,
+        created_at,
+    )
+
+# Article topics for variety
+_TOPICS = (
+    "Technology", "Programming", "Web Development", "Data Science",
+    "Machine Learning", "DevOps", "Cloud Computing", "Security",
+    "Mobile Development", "Database Design", "API Development",
+    "Frontend", "Backend", "Full Stack", "Software Architecture",
+    "Testing", "Agile", "Open Source", "Career", "Tutorial"
+)
+
+# Title patterns as pre-parsed %-templates: exactly one is instantiated per
+# article, instead of building all ten f-strings per row just to pick one
+_TITLE_PATTERNS = (
+    "Getting Started with %s",
+    "Advanced %s Techniques",
+    "%s Best Practices",
+    "Introduction to %s",
+    "%s Tutorial: A Complete Guide",
+    "Understanding %s",
+    "%s Tips and Tricks",
+    "Mastering %s",
+    "%s Fundamentals",
+    "Exploring %s",
+)
+
+# Comment templates for variety
+_COMMENT_TEMPLATES = (
+    "Great article! Very helpful.",
+    "Thanks for sharing this.",
+    "I found this really useful.",
+    "Excellent explanation!",
+    "This helped me understand the concept better.",
+    "Nice write-up!",
+    "I have a question about...",
+    "Could you elaborate on...?",
+    "I disagree with...",
+    "This is exactly what I was looking for!",
+    "Well written and informative.",
+    "I'll definitely try this approach.",
+    "Thanks for the detailed explanation.",
+    "This cleared up my confusion.",
+    "Great examples in this article.",
+)
+
+# Per-worker Faker instance. Workers build their own copy in the Pool
+# initializer because generator state does not survive fork cleanly, so the
+# instance has to live at module level rather than on BlogDataGenerator.
+_fake = None
+
+
+def _init_worker():
+    """Create the per-worker Faker instance (Pool initializer)."""
+    global _fake
+    _fake = Faker()
+
+
+def _seed_shard(seed):
+    """
+    Seed the worker's Faker and random module for a deterministic shard.
+
+    numpy is seeded inside the numeric sampling helpers instead: under
+    numba each compiled function carries its own PRNG state, which only a
+    seed call inside the jitted body reaches.
+    """
+    if seed is not None:
+        _fake.seed_instance(seed)
+        rng_seed(seed)
+
+
+@_njit(cache=True)
+def _article_numeric_cols(count, n_authors, n_topics, n_patterns,
+                          published_ratio, seed, has_seed):
+    """
+    Sample every numeric article column in one pass.
+
+    All the per-row arithmetic (index picks, day offsets, the published
+    coin flip) lives here so the shard function only does list indexing
+    and string assembly. Pass has_seed=False to leave the PRNG state
+    alone.
+    """
+    if has_seed:
+        np.random.seed(seed)
+    author_idx = np.random.randint(0, n_authors, count)
+    topic_idx = np.random.randint(0, n_topics, count)
+    pattern_idx = np.random.randint(0, n_patterns, count)
+    days_ago = np.random.randint(0, 366, count)  # Articles from last year
+    # Publish date falls between created_at and now (inclusive)
+    publish_days_ago = (np.random.random(count) * (days_ago + 1)).astype(np.int64)
+    published = np.random.random(count) < published_ratio
+    return author_idx, topic_idx, pattern_idx, days_ago, publish_days_ago, published
+
+
+@_njit(cache=True)
+def _comment_numeric_cols(count, n_articles, n_templates, seed, has_seed):
+    """
+    Sample every numeric comment column in one pass.
+
+    Same split as _article_numeric_cols: numeric work here, string
+    assembly in the shard function. Pass has_seed=False to leave the
+    PRNG state alone.
+    """
+    if has_seed:
+        np.random.seed(seed)
+    article_idx = np.random.randint(0, n_articles, count)
+    use_template = np.random.random(count) < 0.3
+    template_idx = np.random.randint(0, n_templates, count)
+    days_ago = np.random.randint(0, 181, count)  # Comments from last 6 months
+    return article_idx, use_template, template_idx, days_ago
+
+
+def _gen_authors_shard(args: Tuple) -> AuthorBatch:
+    """Generate one shard of author rows (runs in a worker process)."""
+    seed, count = args
+    _seed_shard(seed)
+
+    # Bulk pre-generate each column, then zip into rows. Usernames/emails
+    # are oversampled 1.5x and deduped with dict.fromkeys (order-preserving)
+    # instead of retrying individual Faker calls on collision; any shortfall
+    # is filled with UUID-based fallbacks. Cross-shard collisions are
+    # resolved post-merge.
+    uuids = _bulk_uuids(count)
+    pool_size = int(count * 1.5)
+    usernames = list(dict.fromkeys(
+        _fake.user_name().lower().replace(' ', '_')
+        for _ in range(pool_size)
+    ))[:count]
+    usernames.extend(f"user_{uuid4().hex[:8]}" for _ in range(count - len(usernames)))
+    emails = list(dict.fromkeys(_fake.email() for _ in range(pool_size)))[:count]
+    emails.extend(f"{uuid4().hex[:8]}@example.com" for _ in range(count - len(emails)))
+    created_ats = [
+        _fake.date_time_between(start_date='-2y', end_date='now').strftime('%Y-%m-%d %H:%M:%S')
+        for _ in range(count)
+    ]
+
+    return AuthorBatch(uuids, usernames, emails, created_ats)
+
+
+def _gen_articles_shard(args: Tuple) -> ArticleBatch:
+    """Generate one shard of article columns (runs in a worker process)."""
+    seed, count, author_ids, published_ratio = args
+    _seed_shard(seed)
+
+    # Bulk pre-generate each column; the numeric columns come out of one
+    # sampling helper call.
+    uuids = _bulk_uuids(count)
+    author_idx, topic_idx, pattern_idx, days_ago, publish_days_ago, published = \
+        _article_numeric_cols(count, len(author_ids), len(_TOPICS),
+                              len(_TITLE_PATTERNS), published_ratio,
+                              0 if seed is None else seed, seed is not None)
+    author_refs = [author_ids[i] for i in author_idx]
+
+    # Generate titles: one template instantiation per article
+    titles = [
+        _TITLE_PATTERNS[pi] % _TOPICS[ti]
+        for ti, pi in zip(topic_idx, pattern_idx)
+    ]
+
+    # Generate content: pull all paragraphs for all articles in one Faker
+    # call, then slice the pool per article
+    paragraph_counts = [randint(3, 8) for _ in range(count)]
+    paragraph_pool = _fake.paragraphs(nb=sum(paragraph_counts))
+    contents = []
+    offset = 0
+    for num_paragraphs in paragraph_counts:
+        contents.append("\n\n".join(paragraph_pool[offset:offset + num_paragraphs]))
+        offset += num_paragraphs
+
+    # Vectorize the date pipeline: one datetime64 batch replaces per-row
+    # datetime/timedelta objects and strftime calls. Published articles get
+    # a publish_date at or after created_at; drafts get none.
+    now = np.datetime64(datetime.now().replace(microsecond=0))
+    created_ats = _bulk_datetimes(now, days_ago)
+    published = published.tolist()
+    publish_dates = [
+        date if is_published else None
+        for date, is_published in zip(_bulk_datetimes(now, publish_days_ago), published)
+    ]
+
+    return ArticleBatch(uuids, titles, contents, publish_dates, published,
+                        author_refs, created_ats)
+
+
+def _gen_comments_shard(args: Tuple) -> CommentBatch:
+    """Generate one shard of comment columns (runs in a worker process)."""
+    seed, count, article_ids = args
+    _seed_shard(seed)
+
+    # Bulk pre-generate each column; the numeric columns come out of one
+    # sampling helper call.
+    uuids = _bulk_uuids(count)
+    article_idx, use_template, template_idx, days_ago = _comment_numeric_cols(
+        count, len(article_ids), len(_COMMENT_TEMPLATES),
+        0 if seed is None else seed, seed is not None)
+    use_template = use_template.tolist()
+    article_refs = [article_ids[i] for i in article_idx]
+    author_names = [_fake.name() for _ in range(count)]
+    author_emails = [_fake.email() for _ in range(count)]
+
+    # Generate content (mix of templates and custom): 30% templates,
+    # 70% custom sentences pre-generated in one batch pass
+    custom_pool = [
+        _fake.sentence(nb_words=randint(5, 20))
+        for _ in range(count - sum(use_template))
+    ]
+    contents = []
+    custom_idx = 0
+    for i, templated in enumerate(use_template):
+        if templated:
+            contents.append(_COMMENT_TEMPLATES[template_idx[i]])
+        else:
+            contents.append(custom_pool[custom_idx])
+            custom_idx += 1
+
+    # Format dates in one datetime64 batch (comments are usually recent,
+    # but can be older); created_at matches comment_date
+    now = np.datetime64(datetime.now().replace(microsecond=0))
+    comment_dates = _bulk_datetimes(now, days_ago)
+
+    return CommentBatch(uuids, article_refs, author_names, author_emails,
+                        contents, comment_dates)
+
+
+def _copy_block(table_spec: str, rows: Iterator[Tuple]) -> str:
+    """
+    Build a COPY ... FROM STDIN (FORMAT csv) block for one table.
+
+    CSV quoting handles embedded quotes, commas and newlines, so rows need
+    no SQL escaping here; None becomes an empty (NULL) field.
+    """
+    buf = io.StringIO()
+    buf.write(f"COPY {table_spec} FROM STDIN WITH (FORMAT csv);\n")
+    writer = csv.writer(buf, lineterminator='\n')
+    for row in rows:
+        writer.writerow(
+            ('TRUE' if value else 'FALSE') if isinstance(value, bool) else value
+            for value in row
+        )
+    buf.write("\\.")
+    return buf.getvalue()
+
 
 class BlogDataGenerator:
     """Generates realistic blog data using Faker."""
 
-    def __init__(self, seed: int = None):
-        """Initialize Faker with optional seed for reproducibility."""
-        self.fake = Faker()
+    def __init__(self, seed: int = None, workers: int = None):
+        """
+        Initialize generation parameters.
+
+        Args:
+            seed: Optional seed for reproducibility
+            workers: Number of worker processes (default: CPU count)
+        """
+        self.seed = seed
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
         if seed is not None:
             Faker.seed(seed)
-            self.fake.seed_instance(seed)
 
-    def generate_authors(self, count: int) -> List[Tuple[str, str, str, str]]:
+    def _run_sharded(self, shard_func, count: int, *extra):
+        """
+        Split `count` across worker processes and merge the shard batches.
+
+        Each shard gets a deterministic seed (seed + shard index, masked
+        to the 32 bits np.random.seed accepts) so runs with --seed stay
+        reproducible regardless of worker scheduling.
+        """
+        shards = min(self.workers, max(1, count // _MIN_SHARD_ROWS))
+        base, remainder = divmod(count, shards)
+        tasks = [
+            (None if self.seed is None else (self.seed + i) & 0xFFFFFFFF,
+             base + (1 if i < remainder else 0),
+             *extra)
+            for i in range(shards)
+        ]
+
+        if len(tasks) == 1:
+            _init_worker()
+            return shard_func(tasks[0])
+
+        with Pool(processes=len(tasks), initializer=_init_worker) as pool:
+            return _merge_batches(pool.map(shard_func, tasks))
+
+    def generate_authors(self, count: int) -> AuthorBatch:
         """
         Generate author data.
-        
-        Returns: List of (uuid, username, email, created_at) tuples
+
+        Returns: AuthorBatch of columnar author rows
         """
-        authors = []
-        usernames = set()
-        
-        for _ in range(count):
-            # Generate unique username
-            username = None
-            attempts = 0
-            while username is None or username in usernames:
-                if attempts > 100:
-                    # Fallback to UUID-based username if too many collisions
-                    username = f"user_{uuid4().hex[:8]}"
-                    break
-                username = self.fake.user_name().lower().replace(' ', '_')
-                attempts += 1
-            
-            usernames.add(username)
-            email = self.fake.unique.email()
-            uuid_str = str(uuid4())
-            created_at = self.fake.date_time_between(start_date='-2y', end_date='now')
-            created_at_str = created_at.strftime('%Y-%m-%d %H:%M:%S')
-            
-            authors.append((uuid_str, username, email, created_at_str))
-        
+        authors = self._run_sharded(_gen_authors_shard, count)
+
+        # Resolve username/email collisions (within and across shards) in a
+        # single in-place dedup pass over each column
+        seen_usernames = set()
+        seen_emails = set()
+        for i, username in enumerate(authors.usernames):
+            if username in seen_usernames:
+                # Fallback to UUID-based username on collision
+                username = f"user_{uuid4().hex[:8]}"
+                authors.usernames[i] = username
+            seen_usernames.add(username)
+        for i, email in enumerate(authors.emails):
+            if email in seen_emails:
+                email = f"{uuid4().hex[:8]}.{email}"
+                authors.emails[i] = email
+            seen_emails.add(email)
+
         return authors
 
     def generate_articles(
-        self, 
-        count: int, 
+        self,
+        count: int,
         author_ids: List[str],
         published_ratio: float = 0.7
-    ) -> List[Tuple[str, str, str, str, str, str, str]]:
+    ) -> ArticleBatch:
         """
         Generate article data.
-        
+
         Args:
             count: Number of articles to generate
             author_ids: List of author UUIDs to reference
             published_ratio: Ratio of published articles (0.0 to 1.0)
-        
-        Returns: List of (uuid, title, content, publish_date, is_published, author_id, created_at) tuples
+
+        Returns: ArticleBatch of columnar article rows
         """
-        articles = []
-        
-        # Article topics for variety
-        topics = [
-            "Technology", "Programming", "Web Development", "Data Science",
-            "Machine Learning", "DevOps", "Cloud Computing", "Security",
-            "Mobile Development", "Database Design", "API Development",
-            "Frontend", "Backend", "Full Stack", "Software Architecture",
-            "Testing", "Agile", "Open Source", "Career", "Tutorial"
-        ]
-        
-        for _ in range(count):
-            uuid_str = str(uuid4())
-            author_id = choice(author_ids)
-            
-            # Generate title
-            topic = choice(topics)
-            title_patterns = [
-                f"Getting Started with {topic}",
-                f"Advanced {topic} Techniques",
-                f"{topic} Best Practices",
-                f"Introduction to {topic}",
-                f"{topic} Tutorial: A Complete Guide",
-                f"Understanding {topic}",
-                f"{topic} Tips and Tricks",
-                f"Mastering {topic}",
-                f"{topic} Fundamentals",
-                f"Exploring {topic}",
-            ]
-            title = choice(title_patterns)
-            
-            # Generate content (paragraphs of text)
-            num_paragraphs = randint(3, 8)
-            content = "\n\n".join(self.fake.paragraphs(nb=num_paragraphs))
-            # Escape single quotes for SQL
-            content = content.replace("'", "''")
-            
-            # Determine if published
-            is_published = random() < published_ratio
-            
-            # Generate dates
-            days_ago = randint(0, 365)  # Articles from last year
-            created_at = datetime.now() - timedelta(days=days_ago)
-            
-            if is_published:
-                # Published articles: publish_date is same or slightly after created_at
-                publish_days_ago = randint(0, days_ago)
-                publish_date = datetime.now() - timedelta(days=publish_days_ago)
-                publish_date_str = f"'{publish_date.strftime('%Y-%m-%d %H:%M:%S')}'"
-            else:
-                # Draft articles: no publish_date
-                publish_date_str = "NULL"
-            
-            created_at_str = f"'{created_at.strftime('%Y-%m-%d %H:%M:%S')}'"
-            
-            articles.append((
-                uuid_str,
-                title.replace("'", "''"),  # Escape single quotes
-                content,
-                publish_date_str,
-                str(is_published).upper(),
-                author_id,
-                created_at_str
-            ))
-        
-        return articles
+        return self._run_sharded(_gen_articles_shard, count, author_ids, published_ratio)
 
     def generate_comments(
         self,
         count: int,
         article_ids: List[str]
-    ) -> List[Tuple[str, str, str, str, str, str, str]]:
+    ) -> CommentBatch:
         """
         Generate comment data.
-        
+
         Args:
             count: Number of comments to generate
             article_ids: List of article UUIDs to reference
-        
-        Returns: List of (uuid, article_id, author_name, author_email, content, comment_date, created_at) tuples
+
+        Returns: CommentBatch of columnar comment rows
         """
-        comments = []
-        
-        # Comment templates for variety
-        comment_templates = [
-            "Great article! Very helpful.",
-            "Thanks for sharing this.",
-            "I found this really useful.",
-            "Excellent explanation!",
-            "This helped me understand the concept better.",
-            "Nice write-up!",
-            "I have a question about...",
-            "Could you elaborate on...?",
-            "I disagree with...",
-            "This is exactly what I was looking for!",
-            "Well written and informative.",
-            "I'll definitely try this approach.",
-            "Thanks for the detailed explanation.",
-            "This cleared up my confusion.",
-            "Great examples in this article.",
-        ]
-        
-        for _ in range(count):
-            uuid_str = str(uuid4())
-            article_id = choice(article_ids)
-            
-            # Generate commenter info
-            author_name = self.fake.name()
-            author_email = self.fake.email()
-            
-            # Generate content (mix of templates and custom)
-            if random() < 0.3:
-                # 30% chance of using template
-                content = choice(comment_templates)
-            else:
-                # 70% chance of generating custom comment
-                content = self.fake.sentence(nb_words=randint(5, 20))
-            
-            # Escape single quotes
-            content = content.replace("'", "''")
-            
-            # Generate dates (comments are usually recent, but can be older)
-            days_ago = randint(0, 180)  # Comments from last 6 months
-            comment_date = datetime.now() - timedelta(days=days_ago)
-            created_at = comment_date  # Usually same as comment_date
-            
-            comment_date_str = f"'{comment_date.strftime('%Y-%m-%d %H:%M:%S')}'"
-            created_at_str = f"'{created_at.strftime('%Y-%m-%d %H:%M:%S')}'"
-            
-            comments.append((
-                uuid_str,
-                article_id,
-                author_name.replace("'", "''"),
-                author_email,
-                content,
-                comment_date_str,
-                created_at_str
-            ))
-        
-        return comments
+        return self._run_sharded(_gen_comments_shard, count, article_ids)
 
-    def generate_sql(
+    def iter_sql(
         self,
-        authors: List[Tuple[str, str, str, str]],
-        articles: List[Tuple[str, str, str, str, str, str, str]],
-        comments: List[Tuple[str, str, str, str, str, str, str]]
-    ) -> str:
-        """Generate SQL INSERT statements."""
-        sql_lines = []
-        
+        authors: AuthorBatch,
+        articles: ArticleBatch,
+        comments: CommentBatch,
+        fmt: str = "insert"
+    ) -> Iterator[str]:
+        """
+        Yield SQL for the three tables as statement-sized chunks.
+
+        Each chunk is a complete comment block or statement, so callers can
+        stream straight to a file (or execute chunk by chunk) while peak
+        memory stays at one batch of formatted rows instead of the whole
+        SQL text.
+
+        Args:
+            fmt: "insert" for multi-row INSERT ... VALUES statements,
+                 "copy" for COPY ... FROM STDIN (FORMAT csv) blocks
+                 (PostgreSQL's fastest bulk-load path)
+        """
         # Header comment
-        sql_lines.append("-- Generated SQL INSERT statements")
-        sql_lines.append(f"-- Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        sql_lines.append(f"-- Authors: {len(authors)}, Articles: {len(articles)}, Comments: {len(comments)}")
-        sql_lines.append("")
-        
-        # Insert Authors
-        sql_lines.append("-- Insert Authors")
-        sql_lines.append("INSERT INTO Authors (id, username, email, created_at) VALUES")
-        author_values = []
-        for uuid_str, username, email, created_at in authors:
-            author_values.append(
-                f"('{uuid_str}', '{username}', '{email}', '{created_at}')"
-            )
-        sql_lines.append(",\n".join(author_values) + ";")
-        sql_lines.append("")
-        
-        # Insert Articles
-        sql_lines.append("-- Insert Articles")
-        sql_lines.append("INSERT INTO Articles (id, title, content, publish_date, is_published, author_id, created_at, updated_at) VALUES")
-        article_values = []
-        for uuid_str, title, content, publish_date, is_published, author_id, created_at in articles:
-            article_values.append(
-                f"('{uuid_str}', '{title}', '{content}', {publish_date}, {is_published}, '{author_id}', {created_at}, {created_at})"
-            )
-        sql_lines.append(",\n".join(article_values) + ";")
-        sql_lines.append("")
-        
-        # Insert Comments
-        sql_lines.append("-- Insert Comments")
-        sql_lines.append("INSERT INTO Comments (id, article_id, author_name, author_email, content, comment_date, created_at) VALUES")
-        comment_values = []
-        for uuid_str, article_id, author_name, author_email, content, comment_date, created_at in comments:
-            comment_values.append(
-                f"('{uuid_str}', '{article_id}', '{author_name}', '{author_email}', '{content}', {comment_date}, {created_at})"
+        yield ("-- Generated SQL INSERT statements\n"
+               f"-- Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+               f"-- Authors: {len(authors)}, Articles: {len(articles)}, Comments: {len(comments)}\n"
+               "\n")
+
+        if fmt == "copy":
+            # Articles duplicate created_at into updated_at
+            article_rows = (
+                row + (row[6],)
+                for row in articles.rows()
             )
-        sql_lines.append(",\n".join(comment_values) + ";")
-        sql_lines.append("")
-        
+            copy_specs = [
+                ("Authors", "Authors (id, username, email, created_at)", authors.rows()),
+                ("Articles", "Articles (id, title, content, publish_date, is_published, author_id, created_at, updated_at)",
+                 article_rows),
+                ("Comments", "Comments (id, article_id, author_name, author_email, content, comment_date, created_at)",
+                 comments.rows()),
+            ]
+            for table, table_spec, rows in copy_specs:
+                yield f"-- Insert {table}\n"
+                yield _copy_block(table_spec, rows) + "\n"
+                yield "\n"
+        else:
+            # One (header, row-formatter, rows) spec per table; each batch is
+            # formatted lazily by a generator expression
+            insert_specs = [
+                ("Authors", "INSERT INTO Authors (id, username, email, created_at) VALUES",
+                 _author_sql_row, authors.rows()),
+                ("Articles", "INSERT INTO Articles (id, title, content, publish_date, is_published, author_id, created_at, updated_at) VALUES",
+                 _article_sql_row, articles.rows()),
+                ("Comments", "INSERT INTO Comments (id, article_id, author_name, author_email, content, comment_date, created_at) VALUES",
+                 _comment_sql_row, comments.rows()),
+            ]
+            for table, header, sql_row, rows in insert_specs:
+                yield f"-- Insert {table}\n"
+                for batch in _batched(rows, _INSERT_BATCH_ROWS):
+                    yield header + "\n" + ",\n".join(sql_row(row) for row in batch) + ";\n"
+                yield "\n"
+
         # Summary
-        sql_lines.append("-- Summary")
-        sql_lines.append("SELECT")
-        sql_lines.append("    'Data Generation Complete' AS message,")
-        sql_lines.append(f"    {len(authors)} AS total_authors,")
-        sql_lines.append(f"    {len(articles)} AS total_articles,")
-        sql_lines.append(f"    {len(comments)} AS total_comments;")
-        
-        return "\n".join(sql_lines)
+        yield ("-- Summary\n"
+               "SELECT\n"
+               "    'Data Generation Complete' AS message,\n"
+               f"    {len(authors)} AS total_authors,\n"
+               f"    {len(articles)} AS total_articles,\n"
+               f"    {len(comments)} AS total_comments;\n")
+
+    def generate_sql(
+        self,
+        authors: AuthorBatch,
+        articles: ArticleBatch,
+        comments: CommentBatch,
+        fmt: str = "insert"
+    ) -> str:
+        """Generate the full SQL text in memory (see iter_sql to stream it)."""
+        return "".join(self.iter_sql(authors, articles, comments, fmt=fmt))
 
 
 def main():
@@ -323,9 +695,22 @@ def main():
         default=0.7,
         help="Ratio of published articles (0.0 to 1.0, default: 0.7)"
     )
-    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes for generation (default: CPU count)"
+    )
+    parser.add_argument(
+        "--format",
+        type=str,
+        choices=["insert", "copy"],
+        default="insert",
+        help="SQL output format: multi-row INSERTs or COPY FROM STDIN csv blocks (default: insert)"
+    )
+
     args = parser.parse_args()
-    
+
     # Validate arguments
     if args.authors < 1:
         print("Error: --authors must be at least 1", file=sys.stderr)
@@ -339,35 +724,39 @@ def main():
     if not 0.0 <= args.published_ratio <= 1.0:
         print("Error: --published-ratio must be between 0.0 and 1.0", file=sys.stderr)
         sys.exit(1)
-    
+    if args.workers is not None and args.workers < 1:
+        print("Error: --workers must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
     print(f"Generating data: {args.authors} authors, {args.articles} articles, {args.comments} comments...", file=sys.stderr)
-    
+
     # Generate data
-    generator = BlogDataGenerator(seed=args.seed)
-    
+    generator = BlogDataGenerator(seed=args.seed, workers=args.workers)
+
     print("Generating authors...", file=sys.stderr)
     authors = generator.generate_authors(args.authors)
-    
+
     print("Generating articles...", file=sys.stderr)
-    author_ids = [a[0] for a in authors]
-    articles = generator.generate_articles(args.articles, author_ids, args.published_ratio)
-    
+    articles = generator.generate_articles(args.articles, authors.ids, args.published_ratio)
+
     print("Generating comments...", file=sys.stderr)
-    article_ids = [a[0] for a in articles]
-    comments = generator.generate_comments(args.comments, article_ids)
-    
+    comments = generator.generate_comments(args.comments, articles.ids)
+
     print("Generating SQL...", file=sys.stderr)
-    sql = generator.generate_sql(authors, articles, comments)
-    
-    # Write output
+    sql_chunks = generator.iter_sql(authors, articles, comments, fmt=args.format)
+
+    # Write output incrementally; only one statement's text is in memory at
+    # a time
     if args.output:
         with open(args.output, 'w', encoding='utf-8') as f:
-            f.write(sql)
+            f.writelines(sql_chunks)
         print(f"SQL written to: {args.output}", file=sys.stderr)
+        # Sidecar lets the verifier skip SQL parsing entirely
+        write_uuid_sidecar(args.output, authors, articles, comments)
+        print(f"UUID sidecar written to: {sidecar_path(args.output)}", file=sys.stderr)
     else:
-        print(sql)
+        sys.stdout.writelines(sql_chunks)
 
 
 if __name__ == "__main__":
     main()
-
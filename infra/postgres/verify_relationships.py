@@ -6,116 +6,484 @@ Checks that:
 - All comments reference existing articles
 """
 
-import re
+import mmap
+import os
 import sys
 
-def extract_uuids_from_sql(sql_file):
-    """Extract all UUIDs from the SQL file and verify relationships."""
-    with open(sql_file, 'r') as f:
-        content = f.read()
-    
-    # Extract author UUIDs
-    author_pattern = r"INSERT INTO Authors.*?VALUES\s+(.*?);"
-    author_match = re.search(author_pattern, content, re.DOTALL)
+# Optional: vectorized fk membership checks. The set-lookup fallback gives
+# identical results, just row at a time.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional: JIT-compile the byte-level row scanner. Without numba the
+# kernel would crawl byte by byte in the interpreter, so workers keep the
+# readline walker instead; with it, the scan drops interpreter dispatch
+# entirely.
+try:
+    from numba import njit as _njit
+    _HAS_NUMBA = np is not None
+except ImportError:
+    _HAS_NUMBA = False
+
+    def _njit(**_kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+# The SQL layout is generator-controlled, so row fields sit at fixed byte
+# offsets and most of the parse is plain slicing: every row line starts
+# with ('<36-char pk>' and comment rows carry their article fk immediately
+# after at [42:78]. The one layout-variable field is an article row's
+# author fk, which sits on the row's last physical line (content embeds
+# newlines) ahead of the two fixed-width timestamps, so it sits at a fixed
+# offset from the line's end instead.
+_UUID_LEN = 36
+
+# Bytes between an article row's author fk closing quote and the row end:
+# ", 'YYYY-MM-DD HH:MM:SS', 'YYYY-MM-DD HH:MM:SS')" plus , or ; (49), and
+# the fk's own 36 chars plus opening quote before that
+_ARTICLE_TAIL_LEN = 49
+_ARTICLE_FK_START = -(_ARTICLE_TAIL_LEN + _UUID_LEN)
+
+# Copy-format (csv) article rows end with ",<created_at>,<updated_at>"
+# after the fk: a comma plus two 19-char timestamps and their separator
+_COPY_ARTICLE_TAIL_LEN = 40
+_COPY_ARTICLE_FK_START = -(_COPY_ARTICLE_TAIL_LEN + _UUID_LEN)
+
+
+def _uuid16(dashed):
+    """
+    Pack a dashed 36-char UUID (bytes) into its raw 16 bytes.
+
+    The sets then hold 16-byte keys instead of 36-char strings: smaller
+    hash surface, and roughly a quarter of the set footprint on large
+    dumps, which keeps the membership sets cache-resident.
+    """
+    return bytes.fromhex(dashed.replace(b'-', b'').decode('ascii'))
+
+
+# Table kinds for the jitted scanner (it only sees numbers)
+_KIND_AUTHORS, _KIND_ARTICLES, _KIND_COMMENTS = 0, 1, 2
+
+
+@_njit(cache=True)
+def _scan_offsets(buf):
+    """
+    Scan the whole dump once and return pk/fk offsets tagged by table.
+
+    A hand-written state machine over uint8 bytes covering both output
+    formats: INSERT INTO and COPY headers switch the current table kind
+    (and mode), insert rows begin with (' and copy rows with a bare
+    dashed uuid, each yielding a pk offset (comments also their fk),
+    and article row-end lines yield the fk offset at a fixed distance
+    from the line end. Designed to compile under numba.njit — no
+    objects, just array writes — so the per-byte walk runs at C speed.
+    Returns (pk_offs, pk_kinds, n_pk, fk_offs, fk_kinds, n_fk).
+    """
+    n = buf.size
+    # Rows are never shorter than ~40 bytes, so this bounds the row count
+    cap = n // 40 + 1
+    pk_offs = np.empty(cap, dtype=np.int64)
+    pk_kinds = np.empty(cap, dtype=np.uint8)
+    fk_offs = np.empty(cap, dtype=np.int64)
+    fk_kinds = np.empty(cap, dtype=np.uint8)
+    n_pk = 0
+    n_fk = 0
+    line_start = 0
+    kind = -1
+    copy_mode = False
+    pending = False
+    for i in range(n + 1):
+        if i != n and buf[i] != 10:  # ord('\n')
+            continue
+        length = i - line_start
+        if (not copy_mode and length >= 2
+                and buf[line_start] == 40 and buf[line_start + 1] == 39):  # ('
+            if kind >= 0:
+                pk_offs[n_pk] = line_start + 2
+                pk_kinds[n_pk] = kind
+                n_pk += 1
+                if kind == 1:
+                    pending = True
+                elif kind == 2:
+                    fk_offs[n_fk] = line_start + 42
+                    fk_kinds[n_fk] = 2
+                    n_fk += 1
+        elif (length >= 19 and buf[line_start] == 73  # I
+                and buf[line_start + 7] == 73):  # INSERT INTO ...
+            first = buf[line_start + 12]
+            if first == 67:  # C -> Comments
+                kind = 2
+            elif first == 65:  # A -> Authors or Articles
+                kind = 0 if buf[line_start + 13] == 117 else 1  # u vs r
+            copy_mode = False
+            pending = False
+        elif (length >= 7 and buf[line_start] == 67 and buf[line_start + 1] == 79
+                and buf[line_start + 2] == 80 and buf[line_start + 3] == 89
+                and buf[line_start + 4] == 32):  # COPY ...
+            first = buf[line_start + 5]
+            if first == 67:  # C -> Comments
+                kind = 2
+            elif first == 65:  # A -> Authors or Articles
+                kind = 0 if buf[line_start + 6] == 117 else 1  # u vs r
+            copy_mode = True
+            pending = False
+        elif (copy_mode and length >= 2
+                and buf[line_start] == 92 and buf[line_start + 1] == 46):  # \.
+            kind = -1
+            pending = False
+        elif (copy_mode and kind >= 0 and length >= 37
+                and buf[line_start + 36] == 44  # , after a dashed uuid
+                and buf[line_start + 8] == 45 and buf[line_start + 13] == 45
+                and buf[line_start + 18] == 45 and buf[line_start + 23] == 45):
+            pk_offs[n_pk] = line_start
+            pk_kinds[n_pk] = kind
+            n_pk += 1
+            if kind == 1:
+                pending = True
+            elif kind == 2:
+                fk_offs[n_fk] = line_start + 37
+                fk_kinds[n_fk] = 2
+                n_fk += 1
+        if kind == 1 and pending:
+            if not copy_mode and length >= 88:
+                # ...'<fk>', '<ts>', '<ts>')<,|;> — fk at fixed offset
+                # from the line end
+                if (buf[i - 3] == 39 and buf[i - 2] == 41
+                        and (buf[i - 1] == 44 or buf[i - 1] == 59)
+                        and buf[i - 86] == 39):
+                    fk_offs[n_fk] = i - 85
+                    fk_kinds[n_fk] = 1
+                    n_fk += 1
+                    pending = False
+            elif copy_mode and length >= 77:
+                # ...",<fk>,<ts>,<ts> — csv tail, fk at fixed offset
+                # from the line end
+                if (buf[i - 20] == 44 and buf[i - 40] == 44
+                        and buf[i - 77] == 44
+                        and buf[i - 68] == 45 and buf[i - 63] == 45):
+                    fk_offs[n_fk] = i - 76
+                    fk_kinds[n_fk] = 1
+                    n_fk += 1
+                    pending = False
+        line_start = i + 1
+    return pk_offs, pk_kinds, n_pk, fk_offs, fk_kinds, n_fk
+
+
+def _scan_file(sql_file):
+    """
+    Parse the whole dump in one sequential pass.
+
+    A current-table state machine keyed off the INSERT INTO and COPY
+    headers — both generator output formats parse in the same walk — so
+    the file's bytes are touched exactly once regardless of how many
+    tables or statements it holds. Returns (author_ids, article_ids,
+    article_refs, comment_refs) with 16-byte keys: the id sets are
+    frozensets and the refs are (pk, fk) pairs in row order.
+
+    With numba installed the line walk is replaced by the jitted
+    _scan_offsets pass over a zero-copy view of the mapping.
+    """
     author_ids = set()
-    
-    if author_match:
-        author_values = author_match.group(1)
-        for match in re.finditer(r"\('([a-f0-9-]{36})'", author_values):
-            author_ids.add(match.group(1))
-    
-    print(f"Found {len(author_ids)} authors")
-    
-    # Extract article UUIDs and their author references
-    article_pattern = r"INSERT INTO Articles.*?VALUES\s+(.*?);"
-    article_match = re.search(article_pattern, content, re.DOTALL)
     article_ids = set()
-    article_author_refs = []
-    
-    if article_match:
-        article_values = article_match.group(1)
-        # Pattern: ('article_uuid', 'title', 'content', publish_date, is_published, 'author_id', ...)
-        # We need to find the 6th field which is the author_id
-        for line in article_values.split('\n'):
-            if line.strip().startswith('('):
-                # Extract article UUID (1st field)
-                uuid_match = re.search(r"\('([a-f0-9-]{36})'", line)
-                if uuid_match:
-                    article_id = uuid_match.group(1)
-                    article_ids.add(article_id)
-                    
-                    # Extract author_id (6th field - after 5 commas)
-                    # This is a simplified approach - in practice, we'd need proper SQL parsing
-                    parts = line.split(',')
-                    if len(parts) >= 6:
-                        # The author_id is the 6th element (index 5), but we need to extract UUID from it
-                        author_ref = parts[5].strip()
-                        author_uuid_match = re.search(r"'([a-f0-9-]{36})'", author_ref)
-                        if author_uuid_match:
-                            article_author_refs.append((article_id, author_uuid_match.group(1)))
-    
-    print(f"Found {len(article_ids)} articles")
-    
-    # Verify article->author relationships
-    invalid_article_refs = []
-    for article_id, author_id in article_author_refs:
-        if author_id not in author_ids:
-            invalid_article_refs.append((article_id, author_id))
-    
+    article_refs = []
+    comment_refs = []
+    pending = None
+    with open(sql_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return frozenset(), frozenset(), [], []
+        with mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ) as mm:
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+            if _HAS_NUMBA:
+                buf = np.frombuffer(mm, dtype=np.uint8)
+                pk_offs, pk_kinds, n_pk, fk_offs, fk_kinds, n_fk = \
+                    _scan_offsets(buf)
+                pk_kinds = pk_kinds[:n_pk]
+                pk_keys = [
+                    _uuid16(bytes(buf[off:off + _UUID_LEN]))
+                    for off in pk_offs[:n_pk]
+                ]
+                fk_keys = [
+                    _uuid16(bytes(buf[off:off + _UUID_LEN]))
+                    for off in fk_offs[:n_fk]
+                ]
+                author_ids = frozenset(
+                    pk for pk, k in zip(pk_keys, pk_kinds)
+                    if k == _KIND_AUTHORS)
+                article_pks = [
+                    pk for pk, k in zip(pk_keys, pk_kinds)
+                    if k == _KIND_ARTICLES]
+                article_ids = frozenset(article_pks)
+                # One fk per row, in row order, so pair by index
+                fk_kinds = fk_kinds[:n_fk]
+                article_refs = list(zip(
+                    article_pks,
+                    (fk for fk, k in zip(fk_keys, fk_kinds)
+                     if k == _KIND_ARTICLES)))
+                comment_pks = [
+                    pk for pk, k in zip(pk_keys, pk_kinds)
+                    if k == _KIND_COMMENTS]
+                comment_refs = list(zip(
+                    comment_pks,
+                    (fk for fk, k in zip(fk_keys, fk_kinds)
+                     if k == _KIND_COMMENTS)))
+                # Release the zero-copy view so the mapping can close
+                del buf
+                return author_ids, article_ids, article_refs, comment_refs
+            table = None
+            copy_mode = False
+            while True:
+                line = mm.readline()
+                if not line:
+                    break
+                if not copy_mode and line[:2] == b"('":
+                    if table == b'Authors':
+                        author_ids.add(_uuid16(line[2:2 + _UUID_LEN]))
+                    elif table == b'Articles':
+                        pending = _uuid16(line[2:2 + _UUID_LEN])
+                        article_ids.add(pending)
+                    elif table == b'Comments':
+                        comment_refs.append(
+                            (_uuid16(line[2:2 + _UUID_LEN]),
+                             _uuid16(line[42:42 + _UUID_LEN])))
+                elif line.startswith(b'INSERT INTO '):
+                    table = line[12:].split(b' ', 1)[0]
+                    copy_mode = False
+                    pending = None
+                elif line.startswith(b'COPY '):
+                    table = line[5:].split(b' ', 1)[0]
+                    copy_mode = True
+                    pending = None
+                elif copy_mode and line[:2] == b'\\.':
+                    table = None
+                    pending = None
+                elif (copy_mode and table is not None
+                        and line[36:37] == b','
+                        and line[8:9] == b'-' and line[13:14] == b'-'
+                        and line[18:19] == b'-' and line[23:24] == b'-'):
+                    # Copy rows open with a bare dashed uuid
+                    if table == b'Authors':
+                        author_ids.add(_uuid16(line[:_UUID_LEN]))
+                    elif table == b'Articles':
+                        pending = _uuid16(line[:_UUID_LEN])
+                        article_ids.add(pending)
+                    elif table == b'Comments':
+                        comment_refs.append(
+                            (_uuid16(line[:_UUID_LEN]),
+                             _uuid16(line[37:37 + _UUID_LEN])))
+                if table == b'Articles' and pending is not None:
+                    stripped = line.rstrip()
+                    if copy_mode:
+                        # Row-end lines close with the csv tail
+                        # ,<fk>,<ts>,<ts> — fk at a fixed distance from
+                        # the end
+                        if (len(stripped) >= 77
+                                and stripped[-20:-19] == b','
+                                and stripped[-40:-39] == b','
+                                and stripped[_COPY_ARTICLE_FK_START - 1:_COPY_ARTICLE_FK_START] == b','
+                                and stripped[-68:-67] == b'-'):
+                            article_refs.append(
+                                (pending,
+                                 _uuid16(stripped[_COPY_ARTICLE_FK_START:-_COPY_ARTICLE_TAIL_LEN])))
+                            pending = None
+                    # Row-end lines close with '),\n or ');\n and the
+                    # fk's opening quote lands at a fixed distance from
+                    # the end
+                    elif (stripped[-3:] in (b"'),", b"');")
+                            and stripped[_ARTICLE_FK_START - 1:_ARTICLE_FK_START] == b"'"):
+                        article_refs.append(
+                            (pending,
+                             _uuid16(stripped[_ARTICLE_FK_START:-_ARTICLE_TAIL_LEN])))
+                        pending = None
+    # Frozen once built: downstream only probes membership
+    return (frozenset(author_ids), frozenset(article_ids),
+            article_refs, comment_refs)
+
+
+def _invalid_refs(refs, valid_ids):
+    """
+    Return the (pk, fk) pairs whose fk is missing from valid_ids.
+
+    With numpy available, the packed 16-byte keys concatenate straight
+    into void16 arrays and the whole check is one vectorized np.isin
+    (void16 rather than S16, which would strip trailing null bytes);
+    otherwise a per-row set lookup. The generated rows are variable
+    width, so vectorizing the parse itself isn't on the table — only
+    this membership step batches cleanly.
+    """
+    if np is None or not refs or not valid_ids:
+        return [(pk, fk) for pk, fk in refs if fk not in valid_ids]
+    fks = np.frombuffer(b''.join(fk for _, fk in refs), dtype='V16')
+    valid = np.frombuffer(b''.join(valid_ids), dtype='V16')
+    return [refs[i] for i in np.nonzero(~np.isin(fks, valid))[0]]
+
+
+def _load_sidecar(sql_file):
+    """
+    Verify against the generator's UUID sidecar, if one is usable.
+
+    generate_test_data.py writes <dump>.uuids.bin next to the SQL: one
+    packed 33-byte record per row (kind byte, raw 16-byte pk, raw
+    16-byte fk). When the sidecar exists, is no older than the dump and
+    numpy is available, the whole check is a frombuffer reshape plus
+    vectorized np.isin — no SQL parsing at all. Returns (author_count,
+    article_count, comment_count, invalid_article_refs,
+    invalid_comment_refs), or None when the sidecar can't be used.
+    """
+    path = os.path.splitext(sql_file)[0] + '.uuids.bin'
+    if np is None or not os.path.exists(path):
+        return None
+    if os.path.getmtime(path) < os.path.getmtime(sql_file):
+        return None  # stale: the dump was regenerated without it
+    rows = np.fromfile(path, dtype=np.dtype(
+        [('kind', 'u1'), ('pk', 'V16'), ('fk', 'V16')]))
+    authors = rows[rows['kind'] == _KIND_AUTHORS]
+    articles = rows[rows['kind'] == _KIND_ARTICLES]
+    comments = rows[rows['kind'] == _KIND_COMMENTS]
+    bad_articles = ~np.isin(articles['fk'], authors['pk'])
+    bad_comments = ~np.isin(comments['fk'], articles['pk'])
+    return (
+        authors.size, articles.size, comments.size,
+        [(pk.tobytes(), fk.tobytes())
+         for pk, fk in zip(articles['pk'][bad_articles],
+                           articles['fk'][bad_articles])],
+        [(pk.tobytes(), fk.tobytes())
+         for pk, fk in zip(comments['pk'][bad_comments],
+                           comments['fk'][bad_comments])],
+    )
+
+
+def extract_uuids_from_sql(sql_file):
+    """Extract all UUIDs from the SQL file and verify relationships."""
+    sidecar = _load_sidecar(sql_file)
+    if sidecar is not None:
+        (author_count, article_count, comment_count,
+         invalid_article_refs, invalid_comment_refs) = sidecar
+    else:
+        # One sequential pass over the file — optimal for the I/O-bound
+        # scan — then the membership checks run over the merged sets
+        # here.
+        author_ids, article_ids, article_refs, comment_refs = \
+            _scan_file(sql_file)
+        author_count = len(author_ids)
+        article_count = len(article_refs)
+        comment_count = len(comment_refs)
+        invalid_article_refs = _invalid_refs(article_refs, author_ids)
+        invalid_comment_refs = _invalid_refs(comment_refs, article_ids)
+
+    # A non-empty dump that yields no rows at all means the scanner
+    # didn't understand the format — failing loudly beats a vacuous pass
+    if (author_count == article_count == comment_count == 0
+            and os.path.getsize(sql_file) > 0):
+        sys.stderr.write(
+            "❌ ERROR: no rows recognized in a non-empty dump — "
+            "unsupported format or corrupt file\n")
+        return False
+
+    # Each report section goes out as one buffered write rather than a
+    # print per line — the diagnostics sit on the CI failure path
+    sys.stdout.write(
+        f"Found {author_count} authors\n"
+        f"Found {article_count} articles\n")
+
+    # Report article->author relationships
     if invalid_article_refs:
-        print(f"\n❌ ERROR: Found {len(invalid_article_refs)} articles referencing non-existent authors!")
-        for article_id, author_id in invalid_article_refs[:5]:
-            print(f"   Article {article_id[:8]}... references author {author_id[:8]}... (NOT FOUND)")
+        sys.stderr.write("\n".join(
+            [f"\n❌ ERROR: Found {len(invalid_article_refs)} articles referencing non-existent authors!"]
+            + [f"   Article {article_id.hex()[:8]}... references author {author_id.hex()[:8]}... (NOT FOUND)"
+               for article_id, author_id in invalid_article_refs[:5]]) + "\n")
         return False
-    else:
-        print(f"✓ All {len(article_author_refs)} articles reference valid authors")
-    
-    # Extract comment UUIDs and their article references
-    comment_pattern = r"INSERT INTO Comments.*?VALUES\s+(.*?);"
-    comment_match = re.search(comment_pattern, content, re.DOTALL)
-    comment_article_refs = []
-    
-    if comment_match:
-        comment_values = comment_match.group(1)
-        for line in comment_values.split('\n'):
-            if line.strip().startswith('('):
-                # Extract comment UUID and article_id (2nd field)
-                uuid_match = re.search(r"\('([a-f0-9-]{36})'", line)
-                if uuid_match:
-                    comment_id = uuid_match.group(1)
-                    # Extract article_id (2nd field - after first comma)
-                    parts = line.split(',')
-                    if len(parts) >= 2:
-                        article_ref = parts[1].strip()
-                        article_uuid_match = re.search(r"'([a-f0-9-]{36})'", article_ref)
-                        if article_uuid_match:
-                            comment_article_refs.append((comment_id, article_uuid_match.group(1)))
-    
-    print(f"Found {len(comment_article_refs)} comments")
-    
-    # Verify comment->article relationships
-    invalid_comment_refs = []
-    for comment_id, article_id in comment_article_refs:
-        if article_id not in article_ids:
-            invalid_comment_refs.append((comment_id, article_id))
-    
+    sys.stdout.write(
+        f"✓ All {article_count} articles reference valid authors\n"
+        f"Found {comment_count} comments\n")
+
+    # Report comment->article relationships
     if invalid_comment_refs:
-        print(f"\n❌ ERROR: Found {len(invalid_comment_refs)} comments referencing non-existent articles!")
-        for comment_id, article_id in invalid_comment_refs[:5]:
-            print(f"   Comment {comment_id[:8]}... references article {article_id[:8]}... (NOT FOUND)")
+        sys.stderr.write("\n".join(
+            [f"\n❌ ERROR: Found {len(invalid_comment_refs)} comments referencing non-existent articles!"]
+            + [f"   Comment {comment_id.hex()[:8]}... references article {article_id.hex()[:8]}... (NOT FOUND)"
+               for comment_id, article_id in invalid_comment_refs[:5]]) + "\n")
         return False
-    else:
-        print(f"✓ All {len(comment_article_refs)} comments reference valid articles")
-    
-    print("\n✅ All referential integrity checks passed!")
+
+    sys.stdout.write(
+        f"✓ All {comment_count} comments reference valid articles\n"
+        "\n✅ All referential integrity checks passed!\n")
     return True
 
+
+def verify_with_duckdb(sql_file):
+    """
+    Verify relationships by loading the dump into DuckDB and anti-joining.
+
+    Re-parsing SQL text in Python duplicates work a database engine does
+    natively: DuckDB executes the INSERTs against a minimal copy of the
+    schema, then each fk check is one vectorized hash anti-join in C++.
+    Only works on insert-format dumps (COPY blocks are a psql construct).
+    """
+    import duckdb
+
+    con = duckdb.connect()
+    con.execute("""
+        CREATE TABLE Authors (id UUID, username VARCHAR, email VARCHAR,
+                              created_at TIMESTAMP);
+        CREATE TABLE Articles (id UUID, title VARCHAR, content VARCHAR,
+                               publish_date TIMESTAMP, is_published BOOLEAN,
+                               author_id UUID, created_at TIMESTAMP,
+                               updated_at TIMESTAMP);
+        CREATE TABLE Comments (id UUID, article_id UUID, author_name VARCHAR,
+                               author_email VARCHAR, content VARCHAR,
+                               comment_date TIMESTAMP, created_at TIMESTAMP);
+    """)
+    with open(sql_file, 'r') as f:
+        con.execute(f.read())
+
+    for table in ('Authors', 'Articles', 'Comments'):
+        count = con.execute(f"SELECT count(*) FROM {table}").fetchone()[0]
+        print(f"Found {count} {table.lower()}")
+
+    ok = True
+    anti_joins = [
+        ("articles", "authors",
+         "SELECT a.id, a.author_id FROM Articles a "
+         "LEFT JOIN Authors u ON a.author_id = u.id WHERE u.id IS NULL"),
+        ("comments", "articles",
+         "SELECT c.id, c.article_id FROM Comments c "
+         "LEFT JOIN Articles a ON c.article_id = a.id WHERE a.id IS NULL"),
+    ]
+    for child, parent, query in anti_joins:
+        invalid = con.execute(query).fetchall()
+        if invalid:
+            ok = False
+            sys.stderr.write("\n".join(
+                [f"\n❌ ERROR: Found {len(invalid)} {child} referencing non-existent {parent}!"]
+                + [f"   {child.capitalize()[:-1]} {str(child_id)[:8]}... references {parent[:-1]} {str(parent_id)[:8]}... (NOT FOUND)"
+                   for child_id, parent_id in invalid[:5]]) + "\n")
+        else:
+            print(f"✓ All {child} reference valid {parent}")
+
+    if ok:
+        print("\n✅ All referential integrity checks passed!")
+    return ok
+
+
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python verify_relationships.py <sql_file>")
+    argv = sys.argv[1:]
+    use_duckdb = '--duckdb' in argv
+    argv = [arg for arg in argv if arg != '--duckdb']
+    if not argv:
+        print("Usage: python verify_relationships.py <sql_file> [--duckdb]")
         sys.exit(1)
-    
-    sql_file = sys.argv[1]
-    success = extract_uuids_from_sql(sql_file)
+
+    sql_file = argv[0]
+    if use_duckdb:
+        try:
+            import duckdb  # noqa: F401
+        except ImportError:
+            print("⚠ duckdb is not installed; falling back to the Python scan", file=sys.stderr)
+            use_duckdb = False
+
+    success = verify_with_duckdb(sql_file) if use_duckdb else extract_uuids_from_sql(sql_file)
     sys.exit(0 if success else 1)
 
@@ -0,0 +1,9 @@
+#!/bin/bash
+# Run the verifier under PyPy when available (3-10x on the scan-heavy
+# path), falling back to CPython otherwise. Usage matches the script:
+#   ./verify_relationships.sh <sql_file> [--duckdb]
+SCRIPT="$(dirname "$0")/verify_relationships.py"
+if command -v pypy3 >/dev/null 2>&1; then
+  exec pypy3 "$SCRIPT" "$@"
+fi
+exec python3 "$SCRIPT" "$@"